@@ -4,6 +4,15 @@
 
 __all__ = [ 'DocParseMeta' ]
 
+# Cache of previously parsed docstrings, keyed by (lexer, parser, class
+# name/qualname/module, docstring).  Avoids re-running a full lex/parse when
+# the same class declaration is processed more than once (e.g., repeated
+# declarations or reloads).  The class identity is part of the key because
+# the lexer and parser are told what class they're parsing for and may fold
+# that into their result.  Note: entries are kept for the life of the
+# process, pinning the lexer/parser classes and parse results they refer to.
+_parse_cache = { }
+
 class DocParseMeta(type):
     '''
     Metaclass that processes the class docstring through a parser and
@@ -45,13 +54,18 @@ class DocParseMeta(type):
     @staticmethod
     def __new__(meta, clsname, bases, clsdict):
         if '__doc__' in clsdict:
-            lexer = meta.lexer()
-            parser = meta.parser()
-            lexer.cls_name = parser.cls_name = clsname
-            lexer.cls_qualname = parser.cls_qualname = clsdict['__qualname__']
-            lexer.cls_module = parser.cls_module = clsdict['__module__']
-            parsedict = parser.parse(lexer.tokenize(clsdict['__doc__']))
-            assert isinstance(parsedict, dict), 'Parser must return a dictionary'
+            key = (meta.lexer, meta.parser, clsname, clsdict['__qualname__'],
+                   clsdict['__module__'], clsdict['__doc__'])
+            parsedict = _parse_cache.get(key)
+            if parsedict is None:
+                lexer = meta.lexer()
+                parser = meta.parser()
+                lexer.cls_name = parser.cls_name = clsname
+                lexer.cls_qualname = parser.cls_qualname = clsdict['__qualname__']
+                lexer.cls_module = parser.cls_module = clsdict['__module__']
+                parsedict = parser.parse(lexer.tokenize(clsdict['__doc__']))
+                assert isinstance(parsedict, dict), 'Parser must return a dictionary'
+                _parse_cache[key] = parsedict
             clsdict.update(parsedict)
         return super().__new__(meta, clsname, bases, clsdict)
 
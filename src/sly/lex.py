@@ -34,7 +34,14 @@
 __all__ = ['Lexer', 'LexerStateChange']
 
 import re
+import sys
 import copy
+import functools
+
+try:
+    from re import _parser as _sre_parse       # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
 
 class LexError(Exception):
     '''
@@ -100,6 +107,13 @@ class _Before:
         self.tok = tok
         self.pattern = pattern
 
+# Cache of compiled master regular expressions.  Subclassing a lexer (e.g., to
+# define a lexing state) rebuilds the class; identical rule sets share the
+# compiled pattern instead of recompiling it.
+@functools.lru_cache(maxsize=256)
+def _compile_master(module, pattern, flags):
+    return module.compile(pattern, flags)
+
 class LexerMetaDict(dict):
     '''
     Special dictionary that prohibits duplicate definitions in lexer specifications.
@@ -148,7 +162,7 @@ class LexerMeta(type):
     def __prepare__(meta, name, bases):
         d = LexerMetaDict()
 
-        def _(pattern, *extra):
+        def _(pattern, *extra, priority=0):
             patterns = [pattern, *extra]
             def decorate(func):
                 pattern = '|'.join(f'({pat})' for pat in patterns )
@@ -156,6 +170,7 @@ class LexerMeta(type):
                     func.pattern = pattern + '|' + func.pattern
                 else:
                     func.pattern = pattern
+                func.priority = priority
                 return func
             return decorate
 
@@ -290,8 +305,14 @@ class Lexer(metaclass=LexerMeta):
 
         cls._collect_rules()
 
+        # Rules with a higher priority are placed earlier in the master regex
+        # alternation so that frequently matched tokens are tried first.  The
+        # sort is stable--rules with equal priority (the default of 0) keep
+        # their definition order.
+        rules = sorted(cls._rules, key=lambda rule: -getattr(rule[1], 'priority', 0))
+
         parts = []
-        for tokname, value in cls._rules:
+        for tokname, value in rules:
             if tokname.startswith('ignore_'):
                 tokname = tokname[7:]
                 cls._ignored_tokens.add(tokname)
@@ -306,26 +327,33 @@ class Lexer(metaclass=LexerMeta):
             # Form the regular expression component
             part = f'(?P<{tokname}>{pattern})'
 
-            # Make sure the individual regex compiles properly
-            try:
-                cpat = cls.regex_module.compile(part, cls.reflags)
-            except Exception as e:
-                raise PatternError(f'Invalid regex for token {tokname}') from e
+            # Validate the pattern and verify that it can't match empty input.
+            # For the standard re module this is done by checking the minimum
+            # width of the parsed pattern, avoiding a compile and a match
+            # against the empty string for every token.  Alternative regex
+            # modules may use extended syntax, so they keep the original check.
+            if cls.regex_module is re:
+                try:
+                    min_width = _sre_parse.parse(part, cls.reflags).getwidth()[0]
+                except Exception as e:
+                    raise PatternError(f'Invalid regex for token {tokname}') from e
+
+                if min_width == 0:
+                    raise PatternError(f'Regex for token {tokname} matches empty input')
+            else:
+                try:
+                    cpat = cls.regex_module.compile(part, cls.reflags)
+                except Exception as e:
+                    raise PatternError(f'Invalid regex for token {tokname}') from e
 
-            # Verify that the pattern doesn't match the empty string
-            if cpat.match(''):
-                raise PatternError(f'Regex for token {tokname} matches empty input')
+                if cpat.match(''):
+                    raise PatternError(f'Regex for token {tokname} matches empty input')
 
             parts.append(part)
 
         if not parts:
             return
 
-        # Form the master regular expression
-        #previous = ('|' + cls._master_re.pattern) if cls._master_re else ''
-        # cls._master_re = cls.regex_module.compile('|'.join(parts) + previous, cls.reflags)
-        cls._master_re = cls.regex_module.compile('|'.join(parts), cls.reflags)
-
         # Verify that that ignore and literals specifiers match the input type
         if not isinstance(cls.ignore, str):
             raise LexerBuildError('ignore specifier must be a string')
@@ -333,6 +361,61 @@ class Lexer(metaclass=LexerMeta):
         if not all(isinstance(lit, str) for lit in cls.literals):
             raise LexerBuildError('literals must be specified as strings')
 
+        if not all(len(lit) == 1 for lit in cls.literals):
+            raise LexerBuildError('literals must be single characters')
+
+        # Form the master regular expression.  The individual patterns have
+        # already been validated, so this normally succeeds on the first try.
+        # If it doesn't, compile the parts one at a time to identify and
+        # report the offending token rule.
+        #previous = ('|' + cls._master_re.pattern) if cls._master_re else ''
+        # cls._master_re = cls.regex_module.compile('|'.join(parts) + previous, cls.reflags)
+        try:
+            cls._master_re = _compile_master(cls.regex_module, '|'.join(parts), cls.reflags)
+        except Exception as e:
+            for part in parts:
+                try:
+                    cls.regex_module.compile(part, cls.reflags)
+                except Exception as e2:
+                    tokname = part[4:part.index('>')]
+                    raise PatternError(f'Invalid regex for token {tokname}') from e2
+            raise LexerBuildError(f'Unable to compile master regex for {cls.__qualname__}') from e
+
+        # Intern all token-type names.  Every tok.type set in tokenize() then
+        # refers to the interned string, so downstream dict lookups and
+        # comparisons keyed by token type short-circuit on pointer identity.
+        cls._token_funcs = { sys.intern(name): func
+                             for name, func in cls._token_funcs.items() }
+        cls._ignored_tokens = { sys.intern(name) for name in cls._ignored_tokens }
+        cls._remapping = { sys.intern(str(name)): { value: sys.intern(str(newtok))
+                                                    for value, newtok in d.items() }
+                           for name, d in cls._remapping.items() }
+
+        # Build dispatch tables indexed by group number.  m.lastindex is an
+        # integer, so classifying a match by group index turns the string-keyed
+        # dict lookups in tokenize() into list indexing.  Unnamed groups nested
+        # inside a rule's pattern map to the nearest preceding named group.
+        ngroups = cls._master_re.groups
+        name_table = [None] * (ngroups + 1)
+        for name, n in cls._master_re.groupindex.items():
+            name_table[n] = sys.intern(name)
+        last = None
+        for n in range(1, ngroups + 1):
+            if name_table[n] is None:
+                name_table[n] = last
+            last = name_table[n]
+
+        cls._name_table = name_table
+        cls._func_table = [ cls._token_funcs.get(name) for name in name_table ]
+        cls._remap_table = [ cls._remapping.get(name) for name in name_table ]
+        cls._ignored_table = [ name in cls._ignored_tokens for name in name_table ]
+
+        # Groups that are ignored and have no attached function or remapping
+        # produce no token at all--tokenize() skips them without allocating
+        cls._skip_table = [ ignored and func is None and remap is None
+                            for ignored, func, remap in
+                            zip(cls._ignored_table, cls._func_table, cls._remap_table) ]
+
     def begin(self, cls):
         '''
         Begin a new lexer state
@@ -358,17 +441,23 @@ class Lexer(metaclass=LexerMeta):
         self.begin(self.__state_stack.pop())
 
     def tokenize(self, text, lineno=1, index=0):
-        _ignored_tokens = _master_re = _ignore = _token_funcs = _literals = _remapping = None
+        _ignored_tokens = _master_match = _ignore = _literals = _token_funcs = None
+        _name_table = _func_table = _remap_table = _ignored_table = _skip_table = None
 
         # --- Support for state changes
         def _set_state(cls):
-            nonlocal _ignored_tokens, _master_re, _ignore, _token_funcs, _literals, _remapping
+            nonlocal _ignored_tokens, _master_match, _ignore, _literals, _token_funcs, \
+                     _name_table, _func_table, _remap_table, _ignored_table, _skip_table
             _ignored_tokens = cls._ignored_tokens
-            _master_re = cls._master_re
+            _master_match = cls._master_re.match
             _ignore = cls.ignore
-            _token_funcs = cls._token_funcs
             _literals = cls.literals
-            _remapping = cls._remapping
+            _token_funcs = cls._token_funcs
+            _name_table = cls._name_table
+            _func_table = cls._func_table
+            _remap_table = cls._remap_table
+            _ignored_table = cls._ignored_table
+            _skip_table = cls._skip_table
 
         self.__set_state = _set_state
         _set_state(type(self))
@@ -389,40 +478,55 @@ class Lexer(metaclass=LexerMeta):
             _set_state(cls)
         self.reject = _reject
 
+        # --- Hot names bound as locals for the inner loop
+        _Token = Token
 
         # --- Main tokenization function
         self.text = text
+        text_len = len(text)
         try:
-            while True:
-                try:
-                    if text[index] in _ignore:
-                        index += 1
-                        continue
-                except IndexError:
-                    return
+            while index < text_len:
+                # Skip ignored characters
+                if text[index] in _ignore:
+                    index += 1
+                    continue
 
-                tok = Token()
-                tok.lineno = lineno
-                tok.index = index
-                m = _master_re.match(text, index)
+                m = _master_match(text, index)
                 if m:
-                    tok.end = index = m.end()
-                    tok.value = m.group()
-                    tok.type = m.lastgroup
+                    gi = m.lastindex
+
+                    # Plain ignored matches produce no token at all
+                    if _skip_table[gi]:
+                        index = m.end()
+                        continue
+
+                    tok = _Token()
+                    tok.lineno = lineno
+                    tok.index = index
+                    tok.end = end = m.end()
+                    tok.value = text[index:end]
+                    index = end
+
+                    tok.type = ttype = _name_table[gi]
 
-                    if tok.type in _remapping:
-                        tok.type = _remapping[tok.type].get(tok.value, tok.type)
+                    remap = _remap_table[gi]
+                    if remap is not None:
+                        tok.type = ttype = remap.get(tok.value, ttype)
+                        func = _token_funcs.get(ttype)
+                    else:
+                        func = _func_table[gi]
 
-                    if tok.type in _token_funcs:
+                    if func is not None:
                         self.index = index
                         self.lineno = lineno
-                        tok = _token_funcs[tok.type](self, tok)
+                        tok = func(self, tok)
                         index = self.index
                         lineno = self.lineno
                         if not tok:
                             continue
-
-                    if tok.type in _ignored_tokens:
+                        if tok.type in _ignored_tokens:
+                            continue
+                    elif _ignored_table[gi]:
                         continue
 
                     yield tok
@@ -430,24 +534,30 @@ class Lexer(metaclass=LexerMeta):
                 else:
                     # No match, see if the character is in literals
                     if text[index] in _literals:
-                        tok.value = text[index]
+                        tok = _Token()
+                        tok.lineno = lineno
+                        tok.index = index
                         tok.end = index + 1
-                        tok.type = tok.value
+                        tok.value = tok.type = text[index]
                         index += 1
                         yield tok
-                    else:
-                        # A lexing error
-                        self.index = index
-                        self.lineno = lineno
-                        tok.type = 'ERROR'
-                        tok.value = text[index:]
-                        tok = self.error(tok)
-                        if tok is not None:
-                            tok.end = self.index
-                            yield tok
+                        continue
 
-                        index = self.index
-                        lineno = self.lineno
+                    # A lexing error
+                    self.index = index
+                    self.lineno = lineno
+                    tok = _Token()
+                    tok.lineno = lineno
+                    tok.index = index
+                    tok.type = 'ERROR'
+                    tok.value = text[index:]
+                    tok = self.error(tok)
+                    if tok is not None:
+                        tok.end = self.index
+                        yield tok
+
+                    index = self.index
+                    lineno = self.lineno
 
         # Set the final state of the lexer before exiting (even if exception)
         finally:
@@ -455,6 +565,12 @@ class Lexer(metaclass=LexerMeta):
             self.index = index
             self.lineno = lineno
 
+    def tokenize_list(self, text, lineno=1, index=0):
+        '''
+        Tokenize all of the input text, returning a list of tokens.
+        '''
+        return list(self.tokenize(text, lineno, index))
+
     # Default implementations of the error handler. May be changed in subclasses
     def error(self, t):
         raise LexError(f'Illegal character {t.value[0]!r} at index {self.index}', t.value, self.index)
@@ -33,7 +33,7 @@
 
 import sys
 import inspect
-from collections import OrderedDict, defaultdict, Counter
+from collections import defaultdict
 
 __all__        = [ 'Parser' ]
 
@@ -149,11 +149,11 @@ class YaccProduction:
         return result
     
     def __getattr__(self, name):
-        if name in self._namemap:
-            return self._namemap[name](self._slice)
-        else:
+        f = self._namemap.get(name)
+        if f is None:
             nameset = '{' + ', '.join(self._namemap) + '}'
             raise AttributeError(f'No symbol {name}. Must be one of {nameset}.')
+        return f(self._slice)
 
     def __setattr__(self, name, value):
         if name[:1] == '_':
@@ -950,7 +950,7 @@ class LRTable(object):
         self._add_count    = 0         # Internal counter used to detect cycles
 
         # Diagonistic information filled in by the table generator
-        self.state_descriptions = OrderedDict()
+        self.state_descriptions = {}
         self.sr_conflict   = 0
         self.rr_conflict   = 0
         self.conflicts     = []        # List of conflicts
@@ -1530,9 +1530,12 @@ class LRTable(object):
                     st_goto[n] = j
                     descrip.append(f'    {n:<30s} shift and go to state {j}')
 
-            action[st] = st_action
+            # Intern the grammar-symbol keys.  Token types coming out of the
+            # lexer are interned, so the action/goto lookups done on every
+            # parser step compare by pointer identity first.
+            action[st] = { sys.intern(a): v for a, v in st_action.items() }
             actionp[st] = st_actionp
-            goto[st] = st_goto
+            goto[st] = { sys.intern(n): j for n, j in st_goto.items() }
             self.state_descriptions[st] = '\n'.join(descrip)
 
     # ----------------------------------------------------------------------
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from sly import Lexer
 
@@ -47,10 +49,13 @@ class CalcLexer(Lexer):
         t.value = t.value.upper()
         return t
 
+    # Set to True to return error tokens from error()
+    return_error = False
+
     def error(self, t):
         self.errors.append(t.value)
         self.index += 1
-        if hasattr(self, 'return_error'):
+        if self.return_error:
             return t
 
     def __init__(self):
@@ -65,6 +70,23 @@ def test_tokens():
     assert types == ['ID','NUMBER','PLUS','MINUS','TIMES','DIVIDE','ASSIGN','LT','LE','(',')']
     assert vals == ['ABC', 123, '+', '-', '*', '/', '=', '<', '<=', '(', ')']
 
+# Test list-mode tokenization
+def test_tokenize_list():
+    lexer = CalcLexer()
+    toks = lexer.tokenize_list('abc 123 + - * / = < <= ( )')
+    types = [t.type for t in toks]
+    vals = [t.value for t in toks]
+    assert types == ['ID','NUMBER','PLUS','MINUS','TIMES','DIVIDE','ASSIGN','LT','LE','(',')']
+    assert vals == ['ABC', 123, '+', '-', '*', '/', '=', '<', '<=', '(', ')']
+
+# Test that the master regex is compiled once at class definition time
+# and shared by all instances
+def test_master_re_cached():
+    a = CalcLexer()
+    b = CalcLexer()
+    assert a._master_re is CalcLexer._master_re
+    assert a._master_re is b._master_re
+
 # Test position tracking
 def test_positions():
     lexer = CalcLexer()
@@ -102,6 +124,49 @@ def test_error():
     assert vals == [123, '+', '-']
     assert lexer.errors == [ ':+-' ]
 
+# Test rule priority ordering
+def test_priority():
+    class PriorityLexer(Lexer):
+        tokens = { NUMBER, FLOAT }
+        ignore = ' '
+
+        NUMBER = r'\d+'
+
+        @_(r'\d+\.\d+', priority=1)
+        def FLOAT(self, t):
+            t.value = float(t.value)
+            return t
+
+    lexer = PriorityLexer()
+    toks = list(lexer.tokenize('3.14 42'))
+    types = [t.type for t in toks]
+    vals = [t.value for t in toks]
+    assert types == ['FLOAT', 'NUMBER']
+    assert vals == [3.14, '42']
+
+# Test that reflags does not affect literal matching
+def test_literal_case():
+    class CaseLexer(Lexer):
+        tokens = { NUM }
+        reflags = re.IGNORECASE
+        ignore = ' '
+        literals = { 'x' }
+
+        NUM = r'\d+'
+
+        def error(self, t):
+            self.errors.append(t.value)
+            self.index += 1
+
+        def __init__(self):
+            self.errors = []
+
+    lexer = CaseLexer()
+    toks = list(lexer.tokenize('x 1 X'))
+    types = [t.type for t in toks]
+    assert types == ['x', 'NUM']
+    assert lexer.errors == ['X']
+
 # Test error token return handling
 def test_error_return():
     lexer = CalcLexer()
@@ -152,10 +217,13 @@ class ModernCalcLexer(Lexer):
         t.value = t.value.upper()
         return t
 
+    # Set to True to return error tokens from error()
+    return_error = False
+
     def error(self, t):
         self.errors.append(t.value)
         self.index += 1
-        if hasattr(self, 'return_error'):
+        if self.return_error:
             return t
 
     def __init__(self):